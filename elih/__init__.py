@@ -11,6 +11,8 @@ from .features import FeatureWeightGroup
 
 from .scoring import score
 
+from .report import ReportRenderer
+
 from .formatters import (
     percent,
     delta_percent,
@@ -10,7 +10,7 @@ from .helpers import (
     _extract_formatted_value,
     _extract_label
 )
-from .features import apply_rules_layer
+from .features import apply_rules_layer, FeatureWeightGroup
 from six import iteritems
 
 env = Environment(
@@ -18,8 +18,17 @@ env = Environment(
     autoescape=select_autoescape(['html'])
 )
 
+
+def _weight_color(weight, weight_range):
+    if not weight_range:
+        # Layer with no (or only null) weights: nothing to highlight
+        weight = 0
+        weight_range = 1
+    return format_hsl(weight_color_hsl(weight, weight_range))
+
+
 env.filters.update(dict(
-    weight_color=lambda w, w_range: format_hsl(weight_color_hsl(w, w_range))
+    weight_color=_weight_color
 ))
 
 
@@ -153,22 +162,40 @@ class HumanExplanation(object):
             )
         return all_repr
 
-    def _repr_html_(self):
-        template = env.get_template('explanation.html')
+    def _template_context(self):
+        """Builds the variables the explanation.html template is rendered with.
+
+        Features are flattened to plain dicts so that the context holds no formatter
+        or scoring function and can be sent to the workers of a process pool.
+        """
         layers = []
-        for index, layer in enumerate(self.explanation_layers):
+        for layer in self.explanation_layers:
             features = layer.targets[0].feature_weights.pos + layer.targets[0].feature_weights.neg
-            weight_range = abs(max([f.weight for f in features]))
+            # pos is sorted by decreasing weight and neg by increasing absolute weight,
+            # so the first feature always holds the highest weight of the layer
+            weight_range = abs(features[0].weight) if features else 0
             layers.append({
-                'features': features,
+                'features': [{
+                    'feature': f.feature,
+                    'label': f.dictionary.get('label') if isinstance(f.dictionary, dict) else None,
+                    'group_size': len(f.group) if isinstance(f, FeatureWeightGroup) else None,
+                    'value': f.value,
+                    'formatted_value': f.formatted_value,
+                    'weight': f.weight,
+                    'score': f.score
+                } for f in features],
                 'weight_range': weight_range
             })
-        return template.render(
+        return dict(
             layers=layers,
             additional_features=self.additional_features,
             interpretations=self.interpretations
         )
 
+    def _repr_html_(self):
+        template = env.get_template('explanation.html')
+        return template.render(**self._template_context())
+
     def to_dict(self):
         return_obj = {}
 
@@ -27,6 +27,15 @@ class EnrichedFeatureWeight(FeatureWeight):
             del kwargs['score']
         FeatureWeight.__init__(self, *args, **kwargs)
 
+    def __getstate__(self):
+        # ELI5 only pickles and copies its own (slotted) fields: keep the enrichment data as well,
+        # otherwise pickled or deep-copied features lose their score, formatted value, dictionary, ...
+        return (FeatureWeight.__getstate__(self), self.__dict__)
+
+    def __setstate__(self, state):
+        FeatureWeight.__setstate__(self, state[0])
+        self.__dict__.update(state[1])
+
     def __repr__(self):
         return "{}(feature='{}', weight={}, score={}, std={}, value={}, formatted_value={}, dictionary={})".format(
             'EnrichedFeatureWeight',
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from functools import partial
+
+from jinja2 import Environment, PackageLoader, select_autoescape
+from eli5.formatters.html import format_hsl, weight_color_hsl
+
+
+class ReportRenderer(object):
+    """Renders many HumanExplanation objects into a single HTML report.
+
+    Compared to calling HumanExplanation._repr_html_ in a loop, the renderer compiles
+    the templates once, memoizes the feature colors over quantized relative weights
+    and writes the report chunk by chunk to a file-like object.
+
+    Args:
+        decimals = 3: The number of decimals the relative weight (weight / weight range)
+            is rounded to before computing a feature color. Lower values mean fewer
+            distinct colors, hence more cache hits.
+        separator = "\\n": The text written between two explanations of the report.
+
+    """
+
+    def __init__(self, decimals=3, separator='\n'):
+        self.decimals = decimals
+        self.separator = separator
+        self._colors = {}
+        self._env = Environment(
+            loader=PackageLoader('elih', 'templates'),
+            autoescape=select_autoescape(['html']),
+            auto_reload=False
+        )
+        self._env.filters.update(dict(
+            weight_color=self.weight_color
+        ))
+        self._template = self._env.get_template('explanation.html')
+
+    def weight_color(self, weight, weight_range):
+        """Returns the CSS color of a feature weight, given the weight range of its layer
+        as computed by HumanExplanation._template_context.
+        """
+        relative_weight = round(weight * 1.0 / weight_range, self.decimals) if weight_range else 0.0
+        color = self._colors.get(relative_weight)
+        if color is None:
+            color = format_hsl(weight_color_hsl(relative_weight, 1.0))
+            self._colors[relative_weight] = color
+        return color
+
+    def render(self, explanation):
+        """Renders a single HumanExplanation as an HTML string.
+        """
+        return self._render_context(explanation._template_context())
+
+    def _render_context(self, context):
+        return self._template.render(**context)
+
+    def stream(self, explanations, fileobj, pool=None, chunksize=32):
+        """Writes the HTML report of several explanations to a file-like object.
+
+        Args:
+            explanations: An iterable of HumanExplanation objects.
+            fileobj: A file-like object opened in text mode (anything with a write method).
+            pool: (optional) A worker pool used to render the explanations in parallel,
+                e.g. a multiprocessing Pool or a concurrent.futures ProcessPoolExecutor.
+                The explanations are still written in the order they were given.
+                Workers only receive the template variables of each explanation (no formatter
+                or scoring function), so process based pools can be used.
+            chunksize = 32: The number of explanations sent to a pool worker at once.
+                Rendering one explanation is fast, so larger chunks keep the inter-process
+                communication from outweighing the rendering itself.
+
+        """
+        for index, explanation_html in enumerate(self._render_all(explanations, pool, chunksize)):
+            if index > 0:
+                fileobj.write(self.separator)
+            fileobj.write(explanation_html)
+
+    def _render_all(self, explanations, pool, chunksize):
+        contexts = (explanation._template_context() for explanation in explanations)
+        if pool is None:
+            return (self._render_context(context) for context in contexts)
+        pool_map = pool.imap if hasattr(pool, 'imap') else pool.map
+        return pool_map(partial(_render_in_worker, self.decimals), contexts, chunksize=chunksize)
+
+
+# Renderers already built in this process, by number of decimals: lets each pool
+# worker compile the templates and fill the colors cache only once.
+_renderers = {}
+
+
+def _render_in_worker(decimals, context):
+    renderer = _renderers.get(decimals)
+    if renderer is None:
+        renderer = ReportRenderer(decimals=decimals)
+        _renderers[decimals] = renderer
+    return renderer._render_context(context)
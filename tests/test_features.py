@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import pickle
+
+from eli5.base import Explanation, TargetExplanation, FeatureWeights
+
+from elih.explanation import translate_explanation
+from elih.features import EnrichedFeatureWeight, FeatureWeightGroup
+
+
+def test_enriched_feature_weight_pickles_enrichment():
+    feature = EnrichedFeatureWeight(
+        feature='Fare', weight=0.2, std=None, value=30.0,
+        score=11.0, formatted_value='30.0 $', dictionary={'label': 'Ticket fare'}
+    )
+    restored = pickle.loads(pickle.dumps(feature))
+    assert restored.to_dict() == feature.to_dict()
+    assert restored.dictionary == {'label': 'Ticket fare'}
+
+
+def test_feature_weight_group_pickles_group():
+    group = FeatureWeightGroup(
+        feature='Person', weight=0.2, std=None, value=None,
+        score=11.0, formatted_value=None, dictionary={},
+        group=[
+            EnrichedFeatureWeight(feature='Sex', weight=0.5, std=None, value=1, score=12.0, formatted_value='female', dictionary={}),
+            EnrichedFeatureWeight(feature='Age', weight=-0.3, std=None, value=40, score=8.0, formatted_value=None, dictionary={})
+        ]
+    )
+    restored = pickle.loads(pickle.dumps(group))
+    assert restored.to_dict() == group.to_dict()
+    assert [f.score for f in restored.group] == [12.0, 8.0]
+
+
+def test_deepcopy_keeps_enrichment():
+    feature = EnrichedFeatureWeight(
+        feature='Fare', weight=0.2, std=None, value=30.0,
+        score=11.0, formatted_value='30.0 $', dictionary={'label': 'Ticket fare'}
+    )
+    copied = copy.deepcopy(feature)
+    assert copied.to_dict() == feature.to_dict()
+    assert copied.dictionary is not feature.dictionary
+
+
+def test_translate_explanation_keeps_enrichment():
+    feature = EnrichedFeatureWeight(
+        feature='Fare', weight=0.2, std=None, value=30.0,
+        score=11.0, formatted_value='30.0 $', dictionary={'label': 'Ticket fare'}
+    )
+    explanation = Explanation(
+        estimator='classifier',
+        targets=[TargetExplanation(target=1, feature_weights=FeatureWeights(pos=[feature], neg=[]))]
+    )
+    translated = translate_explanation(explanation, {'Fare': 'Ticket fare'})
+    translated_feature = translated.targets[0].feature_weights.pos[0]
+    assert translated_feature.feature == 'Ticket fare'
+    assert translated_feature.score == 11.0
+    assert translated_feature.formatted_value == '30.0 $'
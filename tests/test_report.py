@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import io
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+
+from eli5.base import Explanation, TargetExplanation, FeatureWeights, FeatureWeight
+from eli5.formatters.html import format_hsl, weight_color_hsl
+
+import elih
+from elih import report
+
+
+def _explanation(pos, neg):
+    return Explanation(
+        estimator='classifier',
+        targets=[TargetExplanation(target=1, feature_weights=FeatureWeights(pos=pos, neg=neg))]
+    )
+
+
+def _human_explanation(index):
+    explanation = _explanation(
+        pos=[
+            FeatureWeight('Sex=female', 0.5 + index * 0.01, value=1),
+            FeatureWeight('Fare', 0.2, value=30.0)
+        ],
+        neg=[FeatureWeight('Age', -0.3, value=40)]
+    )
+    return elih.HumanExplanation(
+        explanation=explanation,
+        rules_layers=[{'Sex': 'Sex=*'}, {'Person': ['Sex', 'Age']}],
+        additional_features={'Name': 'Jane #{}'.format(index)},
+        dictionary={
+            'Fare': {'label': 'Ticket fare', 'formatter': elih.formatters.value_simplified(unit='$')},
+            'Name': {'label': 'Name', 'formatter': elih.formatters.text()}
+        },
+        scoring=elih.score()
+    )
+
+
+def _lightness(css_color):
+    return float(re.match(r'hsl\(.*, .*%, (.*)%\)', css_color).group(1))
+
+
+def test_render_matches_repr_html():
+    explanation = _human_explanation(0)
+    html = elih.ReportRenderer().render(explanation)
+    assert html == explanation._repr_html_()
+    assert 'Ticket fare' in html
+    assert 'Jane #0' in html
+
+
+def test_stream_joins_rendered_explanations():
+    explanations = [_human_explanation(i) for i in range(5)]
+    renderer = elih.ReportRenderer(separator='<hr>')
+    fileobj = io.StringIO()
+    renderer.stream(explanations, fileobj)
+    assert fileobj.getvalue() == '<hr>'.join(renderer.render(e) for e in explanations)
+
+
+def _stream_with_pool(renderer, explanations, chunksize):
+    fileobj = io.StringIO()
+    pool = Pool(2)
+    try:
+        renderer.stream(explanations, fileobj, pool=pool, chunksize=chunksize)
+    finally:
+        pool.close()
+        pool.join()
+    return fileobj.getvalue()
+
+
+def test_stream_with_process_pool_keeps_order():
+    explanations = [_human_explanation(i) for i in range(10)]
+    renderer = elih.ReportRenderer()
+    sequential = io.StringIO()
+    renderer.stream(explanations, sequential)
+
+    for chunksize in [1, 3, 32]:
+        parallel = _stream_with_pool(renderer, explanations, chunksize)
+        assert parallel == sequential.getvalue()
+        positions = [parallel.index('Jane #{}'.format(i)) for i in range(10)]
+        assert positions == sorted(positions)
+
+
+def test_stream_with_process_pool_executor_keeps_order():
+    explanations = [_human_explanation(i) for i in range(10)]
+    renderer = elih.ReportRenderer()
+    sequential = io.StringIO()
+    renderer.stream(explanations, sequential)
+
+    parallel = io.StringIO()
+    with ProcessPoolExecutor(2) as executor:
+        renderer.stream(explanations, parallel, pool=executor, chunksize=4)
+    assert parallel.getvalue() == sequential.getvalue()
+
+
+def test_worker_renderer_is_built_once_per_decimals():
+    context = _human_explanation(0)._template_context()
+    report._renderers.clear()
+    first = report._render_in_worker(2, context)
+    renderer = report._renderers[2]
+    second = report._render_in_worker(2, context)
+    assert first == second
+    assert list(report._renderers.keys()) == [2]
+    assert report._renderers[2] is renderer
+
+
+def test_quantized_colors_stay_close_to_exact_colors():
+    renderer = elih.ReportRenderer(decimals=3)
+    for weight in [0.001, 0.0123, -0.2, 0.35678, -0.77, 1.0, 1.4]:
+        exact = format_hsl(weight_color_hsl(weight, 1.0))
+        quantized = renderer.weight_color(weight, 1.0)
+        assert abs(_lightness(exact) - _lightness(quantized)) < 0.1
+        assert exact.split(',')[0] == quantized.split(',')[0]
+    assert renderer.weight_color(0.35678, 1.0) is renderer.weight_color(0.3568, 1.0)
+
+
+def test_layer_without_weight_range():
+    empty = elih.HumanExplanation(_explanation(pos=[], neg=[]), {}, scoring=elih.score())
+    assert empty._template_context()['layers'][0]['weight_range'] == 0
+    elih.ReportRenderer().render(empty)
+
+    null = elih.HumanExplanation(_explanation(pos=[FeatureWeight('Fare', 0.0, value=1)], neg=[]), {})
+    assert null._template_context()['layers'][0]['weight_range'] == 0
+    assert elih.ReportRenderer().render(null) == null._repr_html_()